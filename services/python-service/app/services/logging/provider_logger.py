@@ -2,9 +2,11 @@
 Provider logging utilities for separate worker log files.
 Each worker gets its own dedicated log file with proper rotation.
 """
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Dict, Any
 import orjson
@@ -16,6 +18,38 @@ BASE_LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 # Logger cache to avoid creating duplicate loggers
 _LOGGER_CACHE: Dict[str, logging.Logger] = {}
+# Started listeners for queued loggers, stopped once at exit to flush
+_LISTENERS: Dict[str, QueueListener] = {}
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    while _LISTENERS:
+        _, listener = _LISTENERS.popitem()
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the rendered timestamp for records within the same second.
+
+    Hot-path loggers (e.g. orders_calculated) emit many records per second; output is
+    identical to logging.Formatter, but strftime runs at most once per second.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_text = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second or datefmt != self.datefmt:
+            self._cached_text = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_text
 
 
 def _create_rotating_logger(
@@ -23,9 +57,14 @@ def _create_rotating_logger(
     filename: str,
     max_bytes: int = 50 * 1024 * 1024,  # 50MB
     backup_count: int = 10,
-    level: int = logging.INFO
+    level: int = logging.INFO,
+    queued: bool = False
 ) -> logging.Logger:
-    """Create a rotating file logger with specified parameters."""
+    """Create a rotating file logger with specified parameters.
+
+    With queued=True the caller only enqueues records; file writes and rotation
+    run on a QueueListener thread, off the asyncio event loop.
+    """
     
     if name in _LOGGER_CACHE:
         return _LOGGER_CACHE[name]
@@ -70,13 +109,23 @@ def _create_rotating_logger(
         )
     
     # Set formatter
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     handler.setFormatter(formatter)
     
-    logger.addHandler(handler)
+    if queued:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        _LISTENERS[name] = listener
+        queue_handler = QueueHandler(log_queue)
+        # The logger owns its listener through the handler, independent of _LISTENERS
+        queue_handler.listener = listener
+        logger.addHandler(queue_handler)
+    else:
+        logger.addHandler(handler)
     logger.propagate = False  # Don't propagate to root logger
     
     _LOGGER_CACHE[name] = logger
@@ -170,10 +219,34 @@ def get_orders_calculated_logger() -> logging.Logger:
         "provider.orders.calculated",
         "orders_calculated.log",
         max_bytes=200 * 1024 * 1024,  # 200MB
-        backup_count=20
+        backup_count=20,
+        queued=True  # written on every close/open; keep disk I/O off the event loop
     )
 
 
+# Plain orders.calculated file written by the order execution service, trigger
+# worker and reject workers. Resolved and created once at import; ORDERS_LOG_DIR
+# overrides the in-tree logs/ dir.
+ORDERS_LOG_DIR = Path(os.getenv('ORDERS_LOG_DIR') or BASE_LOG_DIR.parent)
+ORDERS_LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def get_orders_calc_file_logger() -> logging.Logger:
+    """Get the orders.calculated logger writing to ORDERS_LOG_DIR/orders_calculated.log."""
+    lg = logging.getLogger("orders.calculated")
+    # Avoid duplicate handlers
+    for h in lg.handlers:
+        if isinstance(h, RotatingFileHandler) and getattr(h, "_orders_calc", False):
+            return lg
+    log_file = ORDERS_LOG_DIR / 'orders_calculated.log'
+    fh = RotatingFileHandler(str(log_file), maxBytes=10_000_000, backupCount=5, encoding='utf-8')
+    fh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    fh._orders_calc = True
+    lg.addHandler(fh)
+    lg.setLevel(logging.INFO)
+    return lg
+
+
 def get_provider_errors_logger() -> logging.Logger:
     """Get logger for provider errors across all workers."""
     return _create_rotating_logger(
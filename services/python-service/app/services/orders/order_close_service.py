@@ -43,6 +43,8 @@ error_logger = get_provider_errors_logger()
 symbol_logger = get_symbol_holders_logger()
 calc_logger = get_orders_calculated_logger()
 
+ORDER_DB_UPDATE_QUEUE = os.getenv("ORDER_DB_UPDATE_QUEUE", "order_db_update_queue")
+
 # User-level locks to prevent race conditions during order operations
 _user_locks: Dict[str, asyncio.Lock] = {}
 _locks_lock = asyncio.Lock()
@@ -116,6 +118,21 @@ async def _save_close_id_to_database(order_id: str, close_id: str, user_type: st
         return False
 
 
+# Optional finalize_close result fields forwarded to the DB consumer when present
+_CLOSE_PASSTHROUGH_FIELDS = (
+    "quantity",
+    "contract_size",
+    "entry_price",
+    "market_close_price",
+    "half_spread",
+    "close_price_adjusted",
+    "pnl_native",
+    "profit_currency",
+    "conversion",
+    "calculation_stage",
+)
+
+
 def build_close_confirmation_payload(
     *,
     order_id: str,
@@ -129,21 +146,22 @@ def build_close_confirmation_payload(
     close_origin: str,
     extra_fields: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
+    get = result.get
     payload = {
         "type": "ORDER_CLOSE_CONFIRMED",
         "order_id": str(order_id),
         "user_id": str(user_id),
         "user_type": str(user_type),
         "order_status": "CLOSED",
-        "close_price": result.get("close_price"),
-        "net_profit": result.get("net_profit"),
-        "commission": result.get("total_commission"),
-        "commission_entry": result.get("commission_entry"),
-        "commission_exit": result.get("commission_exit"),
-        "profit_usd": result.get("profit_usd"),
-        "swap": result.get("swap"),
-        "used_margin_executed": result.get("used_margin_executed"),
-        "used_margin_all": result.get("used_margin_all"),
+        "close_price": get("close_price"),
+        "net_profit": get("net_profit"),
+        "commission": get("total_commission"),
+        "commission_entry": get("commission_entry"),
+        "commission_exit": get("commission_exit"),
+        "profit_usd": get("profit_usd"),
+        "swap": get("swap"),
+        "used_margin_executed": get("used_margin_executed"),
+        "used_margin_all": get("used_margin_all"),
         "symbol": symbol,
         "order_type": order_type,
         "close_message": close_message,
@@ -151,21 +169,8 @@ def build_close_confirmation_payload(
         "close_origin": close_origin,
     }
 
-    passthrough_fields = (
-        "quantity",
-        "contract_size",
-        "entry_price",
-        "market_close_price",
-        "half_spread",
-        "close_price_adjusted",
-        "pnl_native",
-        "profit_currency",
-        "conversion",
-        "calculation_stage",
-    )
-
-    for field in passthrough_fields:
-        value = result.get(field)
+    for field in _CLOSE_PASSTHROUGH_FIELDS:
+        value = get(field)
         if value is not None:
             payload[field] = value
 
@@ -186,14 +191,14 @@ async def publish_close_confirmation(
                 body=orjson.dumps(message),
                 delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
             )
-            await exchange.publish(amqp_message, routing_key=os.getenv("ORDER_DB_UPDATE_QUEUE", "order_db_update_queue"))
+            await exchange.publish(amqp_message, routing_key=ORDER_DB_UPDATE_QUEUE)
         else:
             await publish_db_update(message)
 
         logger.info(
             "[CLOSE:DB_PUBLISHED] order_id=%s queue=%s",
             message.get("order_id"),
-            os.getenv("ORDER_DB_UPDATE_QUEUE", "order_db_update_queue"),
+            ORDER_DB_UPDATE_QUEUE,
         )
     except Exception as e:
         error_logger.error(
@@ -3,12 +3,11 @@ import logging
 import asyncio
 import orjson
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, List
 
 from app.config.redis_config import redis_cluster
 from app.services.logging.redis_order_logger import log_redis_order_event
+from app.services.logging.provider_logger import get_orders_calc_file_logger
 from app.services.orders.order_repository import (
     fetch_user_config,
     fetch_user_portfolio,
@@ -71,27 +70,8 @@ async def _get_user_lock(user_type: str, user_id: str) -> asyncio.Lock:
             _user_locks[user_key] = asyncio.Lock()
         return _user_locks[user_key]
 
-def _get_orders_calc_logger() -> logging.Logger:
-    lg = logging.getLogger("orders.calculated")
-    # Avoid duplicate handlers
-    for h in lg.handlers:
-        if isinstance(h, RotatingFileHandler) and getattr(h, "_orders_calc", False):
-            return lg
-    try:
-        base_dir = Path(__file__).resolve().parents[3]
-    except Exception:
-        base_dir = Path('.')
-    log_dir = base_dir / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / 'orders_calculated.log'
-    fh = RotatingFileHandler(str(log_file), maxBytes=10_000_000, backupCount=5, encoding='utf-8')
-    fh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
-    fh._orders_calc = True
-    lg.addHandler(fh)
-    lg.setLevel(logging.INFO)
-    return lg
-
-_ORDERS_CALC_LOG = _get_orders_calc_logger()
+
+_ORDERS_CALC_LOG = get_orders_calc_file_logger()
 _ORDERS_TIMING_LOG = get_orders_timing_logger()
 
 
@@ -166,3 +166,24 @@ async def remove_takeprofit_trigger(order_id: str) -> bool:
     except Exception as e:
         logger.error("remove_takeprofit_trigger failed for %s: %s", order_id, e)
         return False
+
+
+def queue_remove_stoploss_trigger(pipe, order_id: str, symbol: str, side: str) -> None:
+    """
+    Queue stoploss trigger removal onto a caller-owned pipeline.
+    For callers that already know the order's symbol/side, this skips the
+    order_triggers lookup done by remove_stoploss_trigger.
+    """
+    if symbol and side in ("BUY", "SELL"):
+        pipe.zrem(_sl_key(symbol, side), order_id)
+    pipe.hdel(_order_triggers_key(order_id), "stop_loss", "stop_loss_user", "stop_loss_compare")
+
+
+def queue_remove_takeprofit_trigger(pipe, order_id: str, symbol: str, side: str) -> None:
+    """
+    Queue takeprofit trigger removal onto a caller-owned pipeline.
+    Counterpart of queue_remove_stoploss_trigger.
+    """
+    if symbol and side in ("BUY", "SELL"):
+        pipe.zrem(_tp_key(symbol, side), order_id)
+    pipe.hdel(_order_triggers_key(order_id), "take_profit", "take_profit_user", "take_profit_compare")
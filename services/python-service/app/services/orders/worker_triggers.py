@@ -1,8 +1,6 @@
 import os
 import asyncio
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import aio_pika
@@ -16,6 +14,7 @@ from app.config.redis_logging import (
 )
 from app.services.orders.order_close_service import OrderCloser
 from app.services.logging.redis_order_logger import log_redis_order_event
+from app.services.logging.provider_logger import get_orders_calc_file_logger
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
@@ -35,27 +34,7 @@ def _tp_key(symbol: str, side: str) -> str:
     return f"tp_index:{{{symbol}}}:{side}"
 
 
-def _get_orders_calc_logger() -> logging.Logger:
-    lg = logging.getLogger("orders.calculated")
-    for h in lg.handlers:
-        if isinstance(h, RotatingFileHandler) and getattr(h, "_orders_calc", False):
-            return lg
-    try:
-        base_dir = Path(__file__).resolve().parents[3]
-    except Exception:
-        base_dir = Path('.')
-    log_dir = base_dir / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / 'orders_calculated.log'
-    fh = RotatingFileHandler(str(log_file), maxBytes=10_000_000, backupCount=5, encoding='utf-8')
-    fh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
-    fh._orders_calc = True
-    lg.addHandler(fh)
-    lg.setLevel(logging.INFO)
-    return lg
-
-
-_ORDERS_CALC_LOG = _get_orders_calc_logger()
+_ORDERS_CALC_LOG = get_orders_calc_file_logger()
 
 
 class TriggerMonitor:
@@ -10,6 +10,7 @@ import orjson
 import aio_pika
 
 from app.config.redis_config import redis_cluster
+from app.services.redis_locks import release_lock
 from app.services.pending.provider_pending_monitor import register_provider_pending
 from app.services.logging.provider_logger import (
     get_worker_pending_logger,
@@ -43,25 +44,6 @@ async def acquire_lock(lock_key: str, token: str, ttl_sec: int = 5) -> bool:
         return False
 
 
-async def release_lock(lock_key: str, token: str) -> None:
-    try:
-        # Safe release: only delete if value matches token
-        lua = """
-        if redis.call('get', KEYS[1]) == ARGV[1] then
-            return redis.call('del', KEYS[1])
-        else
-            return 0
-        end
-        """
-        try:
-            await redis_cluster.eval(lua, 1, lock_key, token)
-        except Exception:
-            # Best effort
-            pass
-    except Exception as e:
-        logger.error("release_lock error: %s", e)
-
-
 # Use centralized calculated orders logger
 _ORDERS_CALC_LOG = calc_logger
 
@@ -1,8 +1,6 @@
 import os
 import asyncio
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 import time
 
@@ -10,11 +8,13 @@ import orjson
 import aio_pika
 
 from app.config.redis_config import redis_cluster
+from app.services.redis_locks import release_lock
 from app.services.orders.order_repository import fetch_user_orders
 from app.services.portfolio.user_margin_service import compute_user_total_margin
 from app.services.logging.provider_logger import (
     get_worker_reject_logger,
     get_provider_errors_logger,
+    get_orders_calc_file_logger,
     log_order_processing,
     log_worker_stats
 )
@@ -41,24 +41,6 @@ async def acquire_lock(lock_key: str, token: str, ttl_sec: int = 5) -> bool:
         return False
 
 
-async def release_lock(lock_key: str, token: str) -> None:
-    try:
-        # Safe release
-        lua = """
-        if redis.call('get', KEYS[1]) == ARGV[1] then
-            return redis.call('del', KEYS[1])
-        else
-            return 0
-        end
-        """
-        try:
-            await redis_cluster.eval(lua, 1, lock_key, token)
-        except Exception:
-            pass
-    except Exception as e:
-        logger.error("release_lock error: %s", e)
-
-
 def _determine_rejection_type(redis_status: str) -> str:
     """
     Determine rejection type based on Redis status field.
@@ -473,25 +455,4 @@ if __name__ == "__main__":
 
 
 # ------------- Dedicated calculated orders file logger -------------
-def _get_orders_calc_logger() -> logging.Logger:
-    lg = logging.getLogger("orders.calculated")
-    # Avoid duplicate handlers
-    for h in lg.handlers:
-        if isinstance(h, RotatingFileHandler) and getattr(h, "_orders_calc", False):
-            return lg
-    try:
-        base_dir = Path(__file__).resolve().parents[3]
-    except Exception:
-        base_dir = Path('.')
-    log_dir = base_dir / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / 'orders_calculated.log'
-    fh = RotatingFileHandler(str(log_file), maxBytes=10_000_000, backupCount=5, encoding='utf-8')
-    fh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
-    fh._orders_calc = True
-    lg.addHandler(fh)
-    lg.setLevel(logging.INFO)
-    return lg
-
-
-_ORDERS_CALC_LOG = _get_orders_calc_logger()
+_ORDERS_CALC_LOG = get_orders_calc_file_logger()
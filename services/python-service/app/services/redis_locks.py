@@ -0,0 +1,29 @@
+"""
+Redis Locks
+Token-checked release for the SET NX locks taken by the provider workers
+"""
+import logging
+
+from app.config.redis_config import redis_cluster
+
+
+logger = logging.getLogger(__name__)
+
+# Safe release: only delete if value matches token. Registered once so unlocks
+# go out as EVALSHA (the script is loaded on the first NOSCRIPT reply).
+_RELEASE_LOCK_LUA = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+else
+    return 0
+end
+"""
+_RELEASE_LOCK_SCRIPT = redis_cluster.register_script(_RELEASE_LOCK_LUA)
+
+
+async def release_lock(lock_key: str, token: str) -> None:
+    """Delete lock_key if it still holds token. Best effort: errors are logged, not raised."""
+    try:
+        await _RELEASE_LOCK_SCRIPT(keys=[lock_key], args=[token])
+    except Exception as e:
+        logger.error("release_lock error for %s: %s", lock_key, e)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Unit tests for _prefilter_ord_status in app/services/provider/worker_close.py
+- Reads execution_report.ord_status from compact JSON bodies
+- Returns None (full parse) for nested, sibling, escaped or missing values
+
+Run: python tests/test_worker_close_prefilter.py
+"""
+import orjson
+
+from app.services.provider.worker_close import _prefilter_ord_status
+
+
+def _body(payload):
+    return orjson.dumps(payload)
+
+
+def test_reads_execution_report_status():
+    body = _body({"order_id": "1", "execution_report": {"order_id": "1", "ord_status": "executed"}})
+    assert _prefilter_ord_status(body) == "EXECUTED"
+
+
+def test_status_after_nested_raw_is_not_trusted():
+    # raw precedes ord_status, so the scan cannot tell the keys apart
+    body = _body({"execution_report": {"raw": {"39": "2"}, "ord_status": "REJECTED"}})
+    assert _prefilter_ord_status(body) is None
+
+
+def test_nested_raw_ord_status_is_ignored():
+    body = _body({"execution_report": {"order_id": "1", "raw": {"ord_status": "REJECTED"}}})
+    assert _prefilter_ord_status(body) is None
+
+
+def test_sibling_object_ord_status_is_ignored():
+    body = _body({"execution_report": {"order_id": "1"}, "routing": {"ord_status": "REJECTED"}})
+    assert _prefilter_ord_status(body) is None
+
+
+def test_unreadable_values_fall_back_to_full_parse():
+    assert _prefilter_ord_status(_body({"order_id": "1"})) is None
+    assert _prefilter_ord_status(_body({"execution_report": {"ord_status": ""}})) is None
+    assert _prefilter_ord_status(_body({"execution_report": {"ord_status": 2}})) is None
+    assert _prefilter_ord_status(b'{"execution_report":{"ord_status":"EXE\\"CUTED"}}') is None
+    # Non-compact JSON does not match the marker at all
+    assert _prefilter_ord_status(b'{"execution_report": {"ord_status": "REJECTED"}}') is None
+
+
+if __name__ == "__main__":
+    test_reads_execution_report_status()
+    test_status_after_nested_raw_is_not_trusted()
+    test_nested_raw_ord_status_is_ignored()
+    test_sibling_object_ord_status_is_ignored()
+    test_unreadable_values_fall_back_to_full_parse()
+    print("✅ test_worker_close_prefilter: all tests passed")